@@ -0,0 +1,64 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TtlLruCache:
+    """
+    Потокобезопасный кэш в памяти процесса с вытеснением по LRU и временем жизни записей.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300.0):
+        """
+        Инициализирует пустой кэш.
+
+        :param maxsize: Максимальное количество записей.
+        :param ttl: Время жизни записи в секундах.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """
+        Возвращает значение по ключу, если запись есть и не устарела.
+
+        :param key: Ключ записи.
+        :param default: Значение, возвращаемое при промахе.
+        :return: Значение записи или default.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires, value = item
+            if expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Сохраняет значение, вытесняя самые давно использованные записи при переполнении.
+
+        :param key: Ключ записи.
+        :param value: Значение записи.
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Удаляет все записи.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,12 +1,64 @@
+import asyncio
+import atexit
+import base64
+import functools
+import gzip
+import hashlib
 import http.client
+import itertools
 import json
+import logging
+import os
+import re
+import select
+import socket
 import ssl
+import struct
 import tempfile
+import threading
+import zlib
 from abc import ABC, abstractmethod
-from types import NoneType
-from typing import Optional, Dict, Any, Union, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from json.decoder import scanstring
+from json.encoder import encode_basestring_ascii
+from typing import Optional, Dict, Any, Union, List, Tuple, Iterable, Iterator
 from urllib.parse import urlparse
 
+logger = logging.getLogger(__name__)
+
+# Ошибки, которыми проявляется соединение, закрытое сервером во время простоя.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+_SUPPORTED_SCHEMES = frozenset({"http", "https"})
+_SUPPORTED_WS_SCHEMES = frozenset({"ws", "wss"})
+_SUPPORTED_VERSIONS = frozenset({"2.0"})
+
+# Общий кодировщик без пробелов-разделителей: не создается заново на каждый вызов
+# и дает более короткое тело запроса.
+_json_encoder = json.JSONEncoder(separators=(',', ':'))
+
+_json_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Размер части тела ответа при потоковом чтении.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Неизменная часть JSON-RPC запроса: кодируются только подставляемые значения.
+_PAYLOAD_TEMPLATE = '{"jsonrpc":%s,"method":%%s,"params":%%s,"id":%%s}'
+_PAYLOAD_TEMPLATE_NO_PARAMS = '{"jsonrpc":%s,"method":%%s,"id":%%s}'
+
+_HEADERS = {"Content-Type": "application/json", "Accept-Encoding": "gzip, deflate"}
+
+_WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+_WS_OPCODE_TEXT = 0x1
+_WS_OPCODE_CLOSE = 0x8
+_WS_OPCODE_PING = 0x9
+_WS_OPCODE_PONG = 0xA
+
+# Контекст без клиентского сертификата: системные корневые сертификаты
+# читаются один раз при импорте, а не при каждом HTTPS соединении.
+_DEFAULT_SSL_CONTEXT = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+
 
 class Transport(ABC):
     """
@@ -42,12 +94,87 @@ class Transport(ABC):
         """
         pass
 
+    def call_batch(self,
+                   scheme: str,
+                   host: str,
+                   port: int,
+                   url: str,
+                   calls: List[Tuple[str, Optional[Union[Dict[str, Any], List[Any]]], int]],
+                   version: str,
+                   certfile: Optional[str] = None,
+                   keyfile: Optional[str] = None) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Выполняет пакет JSON-RPC вызовов одним запросом.
+
+        :param scheme: Протокол (http или https).
+        :param host: Хост сервера.
+        :param port: Порт сервера.
+        :param url: URL-путь для вызова.
+        :param calls: Список вызовов (имя метода, параметры, идентификатор вызова).
+        :param version: Версия JSON-RPC.
+        :param certfile: Путь к файлу сертификата (опционально).
+        :param keyfile: Путь к файлу ключа (опционально).
+        :return: Список ответов от сервера или один ответ с ошибкой для всего пакета.
+        :raises NotImplementedError: Если транспорт не поддерживает пакетные вызовы.
+        """
+        raise NotImplementedError(f'{type(self).__name__} does not support batch calls')
+
+    def call_raw(self,
+                 scheme: str,
+                 host: str,
+                 port: int,
+                 url: str,
+                 method: str,
+                 params: Optional[Union[Dict[str, Any], List[Any]]],
+                 call_id: int,
+                 version: str,
+                 certfile: Optional[str] = None,
+                 keyfile: Optional[str] = None) -> 'StreamedResponse':
+        """
+        Выполняет JSON-RPC вызов и возвращает тело ответа для чтения по частям, без разбора.
+
+        :param scheme: Протокол (http или https).
+        :param host: Хост сервера.
+        :param port: Порт сервера.
+        :param url: URL-путь для вызова.
+        :param method: Имя метода JSON-RPC.
+        :param params: Параметры метода JSON-RPC (словарь или список).
+        :param call_id: Идентификатор вызова.
+        :param version: Версия JSON-RPC.
+        :param certfile: Путь к файлу сертификата (опционально).
+        :param keyfile: Путь к файлу ключа (опционально).
+        :return: Ответ, читаемый по частям.
+        :raises NotImplementedError: Если транспорт не поддерживает потоковое чтение ответа.
+        """
+        raise NotImplementedError(f'{type(self).__name__} does not support raw calls')
+
 
 class HttpTransport(Transport):
     """
     Реализация транспорта для выполнения JSON-RPC вызовов через HTTP/HTTPS.
+
+    Соединения не закрываются после вызова, а возвращаются в пул своего адреса
+    и переиспользуются (keep-alive), поэтому TCP и TLS рукопожатия выполняются
+    один раз на соединение, а не на каждый вызов. Ответы, сжатые сервером
+    (gzip или deflate), распаковываются автоматически.
     """
 
+    def __init__(self, compress_threshold: Optional[int] = None, pool_maxsize: int = 10):
+        """
+        Инициализирует пустой пул соединений.
+
+        :param compress_threshold: Размер тела запроса в байтах, начиная с которого
+            оно сжимается gzip (опционально, по умолчанию тело не сжимается).
+        :param pool_maxsize: Максимальное количество простаивающих соединений
+            на один адрес; лишние соединения закрываются.
+        """
+        self.compress_threshold = compress_threshold
+        self.pool_maxsize = pool_maxsize
+        self._connections: Dict[Tuple[str, str, int, Optional[str], Optional[str]],
+                                List[Union[http.client.HTTPConnection,
+                                           http.client.HTTPSConnection]]] = {}
+        self._lock = threading.Lock()
+
     def call(
             self,
             scheme: str,
@@ -77,14 +204,263 @@ class HttpTransport(Transport):
         :raises ValueError: Если схема не поддерживается.
         """
         self._validate_scheme(scheme)
-        conn = self._create_connection(scheme, host, port, certdata, keydata)
         payload = self._create_payload(method, params, call_id, version)
+        return self._post((scheme, host, port, certdata, keydata), url, payload)
+
+    def call_batch(
+            self,
+            scheme: str,
+            host: str,
+            port: int,
+            url: str,
+            calls: List[Tuple[str, Optional[Union[Dict[str, Any], List[Any]]], int]],
+            version: str,
+            certdata: Optional[str] = None,
+            keydata: Optional[str] = None) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Выполняет пакет JSON-RPC вызовов одним HTTP/HTTPS запросом.
+
+        :param scheme: Протокол (http или https).
+        :param host: Хост сервера.
+        :param port: Порт сервера.
+        :param url: URL-путь для вызова.
+        :param calls: Список вызовов (имя метода, параметры, идентификатор вызова).
+        :param version: Версия JSON-RPC.
+        :param certdata: Данные сертификата в виде строки (опционально).
+        :param keydata: Данные ключа в виде строки (опционально).
+        :return: Список ответов от сервера или один ответ с ошибкой для всего пакета.
+        :raises ValueError: Если схема не поддерживается.
+        """
+        self._validate_scheme(scheme)
+        payload = '[' + ','.join(self._create_payload(method, params, call_id, version)
+                                 for method, params, call_id in calls) + ']'
+        return self._post((scheme, host, port, certdata, keydata), url, payload)
+
+    def call_raw(
+            self,
+            scheme: str,
+            host: str,
+            port: int,
+            url: str,
+            method: str,
+            params: Optional[Union[Dict[str, Any], List[Any]]],
+            call_id: int,
+            version: str,
+            certdata: Optional[str] = None,
+            keydata: Optional[str] = None) -> 'StreamedResponse':
+        """
+        Выполняет JSON-RPC вызов через HTTP/HTTPS и возвращает тело ответа без разбора.
+
+        Тело читается с сервера по частям по мере итерации, соединение
+        возвращается в пул после чтения всего тела.
+
+        :param scheme: Протокол (http или https).
+        :param host: Хост сервера.
+        :param port: Порт сервера.
+        :param url: URL-путь для вызова.
+        :param method: Имя метода JSON-RPC.
+        :param params: Параметры метода JSON-RPC (словарь или список).
+        :param call_id: Идентификатор вызова.
+        :param version: Версия JSON-RPC.
+        :param certdata: Данные сертификата в виде строки (опционально).
+        :param keydata: Данные ключа в виде строки (опционально).
+        :return: Ответ, читаемый по частям.
+        :raises ValueError: Если схема не поддерживается.
+        """
+        self._validate_scheme(scheme)
+        payload = self._create_payload(method, params, call_id, version)
+        return StreamedResponse(self._stream((scheme, host, port, certdata, keydata), url, payload))
+
+    def _post(self,
+              key: Tuple[str, str, int, Optional[str], Optional[str]],
+              url: str,
+              payload: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Отправляет тело запроса через соединение из пула и разбирает ответ.
+
+        :param key: Ключ пула (схема, хост, порт, сертификат, ключ).
+        :param url: URL-путь для вызова.
+        :param payload: JSON-строка для тела запроса.
+        :return: Разобранный JSON ответа.
+        """
+        conn, resp = self._send(key, url, payload)
+        try:
+            data = resp.read()
+        except Exception:
+            conn.close()
+            raise
+        self._release_connection(key, conn, resp)
+        return json.loads(self._decompress(data, resp.getheader('Content-Encoding')))
+
+    def _stream(self,
+                key: Tuple[str, str, int, Optional[str], Optional[str]],
+                url: str,
+                payload: str) -> Iterator[bytes]:
+        """
+        Отправляет тело запроса и отдает тело ответа по частям.
+
+        :param key: Ключ пула (схема, хост, порт, сертификат, ключ).
+        :param url: URL-путь для вызова.
+        :param payload: JSON-строка для тела запроса.
+        :return: Итератор частей тела ответа (уже распакованных).
+        """
+        conn, resp = self._send(key, url, payload)
+        try:
+            encoding = resp.getheader('Content-Encoding')
+            # 32 + MAX_WBITS - автоматическое определение заголовка gzip или zlib.
+            decompressor = (zlib.decompressobj(32 + zlib.MAX_WBITS)
+                            if encoding in ('gzip', 'deflate') else None)
+            # Некоторые серверы отдают deflate без zlib-заголовка. Пока распакованных
+            # данных нет, начало тела сохраняется, чтобы распаковать его заново.
+            raw_head = b'' if encoding == 'deflate' else None
+            while chunk := resp.read(_STREAM_CHUNK_SIZE):
+                if decompressor is not None:
+                    if raw_head is not None:
+                        raw_head += chunk
+                    try:
+                        chunk = decompressor.decompress(chunk)
+                    except zlib.error:
+                        if raw_head is None:
+                            raise
+                        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                        chunk = decompressor.decompress(raw_head)
+                        raw_head = None
+                if chunk:
+                    raw_head = None
+                    yield chunk
+            if decompressor is not None and (tail := decompressor.flush()):
+                yield tail
+        except BaseException:
+            # В том числе GeneratorExit: недочитанное соединение нельзя вернуть в пул.
+            conn.close()
+            raise
+        self._release_connection(key, conn, resp)
+
+    def _send(self,
+              key: Tuple[str, str, int, Optional[str], Optional[str]],
+              url: str,
+              payload: str) -> Tuple[Union[http.client.HTTPConnection, http.client.HTTPSConnection],
+    http.client.HTTPResponse]:
+        """
+        Отправляет тело запроса через соединение из пула и получает заголовки ответа.
+
+        :param key: Ключ пула (схема, хост, порт, сертификат, ключ).
+        :param url: URL-путь для вызова.
+        :param payload: JSON-строка для тела запроса.
+        :return: Кортеж (соединение, ответ с непрочитанным телом).
+        """
         headers = self._create_headers()
-        conn.request("POST", url, body=payload, headers=headers)
-        resp = conn.getresponse()
-        data = resp.read().decode("utf-8")
+        if self.compress_threshold is not None and len(payload) >= self.compress_threshold:
+            payload = gzip.compress(payload.encode('utf-8'), compresslevel=1)
+            headers = {**headers, 'Content-Encoding': 'gzip'}
+        fresh = False
+        while True:
+            conn, reused = self._acquire_connection(key, fresh)
+            try:
+                conn.request("POST", url, body=payload, headers=headers)
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # Сервер закрыл простаивающее соединение до отправки запроса - повторяем на новом.
+                fresh = True
+                continue
+            except Exception:
+                conn.close()
+                raise
+            try:
+                resp = conn.getresponse()
+            except Exception:
+                # Запрос уже отправлен и мог быть выполнен. Методы JSON-RPC не обязаны
+                # быть идемпотентными, поэтому вызов не повторяется.
+                conn.close()
+                raise
+            return conn, resp
+
+    def close(self) -> None:
+        """
+        Закрывает все простаивающие соединения пула.
+        """
+        with self._lock:
+            connections = [conn for idle in self._connections.values() for conn in idle]
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+
+    def __enter__(self) -> 'HttpTransport':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _acquire_connection(
+            self,
+            key: Tuple[str, str, int, Optional[str], Optional[str]],
+            fresh: bool = False) -> Tuple[Union[http.client.HTTPConnection,
+    http.client.HTTPSConnection], bool]:
+        """
+        Берет простаивающее соединение из пула или создает новое.
+
+        :param key: Ключ пула (схема, хост, порт, сертификат, ключ).
+        :param fresh: Не использовать соединения из пула.
+        :return: Кортеж (соединение, признак повторного использования).
+        """
+        while not fresh:
+            with self._lock:
+                idle = self._connections.get(key)
+                if not idle:
+                    break
+                conn = idle.pop()
+            if not self._is_connection_dropped(conn):
+                return conn, True
+            conn.close()
+        return self._create_connection(*key), False
+
+    @staticmethod
+    def _is_connection_dropped(conn: Union[http.client.HTTPConnection, http.client.HTTPSConnection]) -> bool:
+        """
+        Проверяет, закрыл ли сервер простаивающее соединение.
+
+        Простаивающее соединение не должно быть доступно для чтения: готовность
+        к чтению означает, что сервер закрыл его (или прислал лишние данные).
+
+        :param conn: Соединение из пула.
+        :return: True, если соединение нельзя использовать повторно.
+        """
+        sock = conn.sock
+        if sock is None:
+            # Соединение еще не открыто и будет открыто при отправке запроса.
+            return False
+        try:
+            if hasattr(select, 'poll'):
+                # poll не ограничен FD_SETSIZE, в отличие от select.
+                poller = select.poll()
+                poller.register(sock, select.POLLIN)
+                return bool(poller.poll(0))
+            return bool(select.select([sock], [], [], 0)[0])
+        except (OSError, ValueError):
+            return True
+
+    def _release_connection(
+            self,
+            key: Tuple[str, str, int, Optional[str], Optional[str]],
+            conn: Union[http.client.HTTPConnection, http.client.HTTPSConnection],
+            resp: http.client.HTTPResponse) -> None:
+        """
+        Возвращает соединение в пул, если сервер не потребовал его закрыть
+        и пул для адреса еще не заполнен.
+
+        :param key: Ключ пула (схема, хост, порт, сертификат, ключ).
+        :param conn: Соединение после прочитанного ответа.
+        :param resp: Ответ сервера.
+        """
+        if not resp.will_close:
+            with self._lock:
+                idle = self._connections.setdefault(key, [])
+                if len(idle) < self.pool_maxsize:
+                    idle.append(conn)
+                    return
         conn.close()
-        return json.loads(data)
 
     @staticmethod
     def _validate_scheme(scheme: str) -> None:
@@ -94,7 +470,7 @@ class HttpTransport(Transport):
         :param scheme: Протокол (http или https).
         :raises ValueError: Если схема не поддерживается.
         """
-        if scheme not in ("http", "https"):
+        if scheme not in _SUPPORTED_SCHEMES:
             raise ValueError(f'Scheme "{scheme}" is not supported. Use "http" or "https".')
 
     def _create_connection(
@@ -120,43 +496,64 @@ class HttpTransport(Transport):
             return http.client.HTTPSConnection(host, port, context=context)
         return http.client.HTTPConnection(host, port)
 
-    def _create_ssl_context(self, certdata: Optional[str],
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _create_ssl_context(certdata: Optional[str],
                             keydata: Optional[str]) -> ssl.SSLContext:
         """
         Создает SSL-контекст и загружает сертификат и ключ, если они предоставлены.
 
+        Контексты кэшируются по паре (сертификат, ключ), поэтому системные
+        корневые сертификаты и PEM-данные разбираются один раз, а не при
+        каждом соединении.
+
         :param certdata: Данные сертификата в виде строки (опционально).
         :param keydata: Данные ключа в виде строки (опционально).
         :return: SSL-контекст.
         """
+        if not (certdata and keydata):
+            return _DEFAULT_SSL_CONTEXT
         context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        if certdata and keydata:
-            certfile, keyfile = self._create_temp_cert_key_files(certdata, keydata)
-            context.load_cert_chain(certfile.name, keyfile.name)
+        HttpTransport._load_cert_chain(context, certdata, keydata)
         return context
 
     @staticmethod
-    def _create_temp_cert_key_files(certdata: str,
-                                    keydata: str) -> tuple[tempfile.NamedTemporaryFile,
-    tempfile.NamedTemporaryFile]:
+    def _load_cert_chain(context: ssl.SSLContext, certdata: str, keydata: str) -> None:
         """
-        Создает временные файлы для сертификата и ключа.
+        Загружает сертификат и ключ в SSL-контекст, не оставляя их на диске.
 
+        ssl умеет читать цепочку сертификатов только по пути к файлу, поэтому
+        там, где это возможно, данные записываются в анонимные файлы в памяти
+        (memfd). На остальных платформах используется временный каталог,
+        доступный только владельцу, который удаляется сразу после загрузки.
+
+        :param context: SSL-контекст.
         :param certdata: Данные сертификата в виде строки.
         :param keydata: Данные ключа в виде строки.
-        :return: Кортеж из временных файлов (сертификат, ключ).
         """
-        certfile = tempfile.NamedTemporaryFile(delete=False)
-        keyfile = tempfile.NamedTemporaryFile(delete=False)
-        certfile.write(certdata.encode('utf-8'))
-        certfile.flush()
-        keyfile.write(keydata.encode('utf-8'))
-        keyfile.flush()
-        return certfile, keyfile
+        if hasattr(os, 'memfd_create'):
+            certfd = os.memfd_create('jrpc-cert')
+            keyfd = os.memfd_create('jrpc-key')
+            try:
+                os.write(certfd, certdata.encode('utf-8'))
+                os.write(keyfd, keydata.encode('utf-8'))
+                context.load_cert_chain(f'/proc/self/fd/{certfd}', f'/proc/self/fd/{keyfd}')
+            finally:
+                os.close(certfd)
+                os.close(keyfd)
+            return
+        with tempfile.TemporaryDirectory() as tmpdir:
+            certfile = os.path.join(tmpdir, 'cert.pem')
+            keyfile = os.path.join(tmpdir, 'key.pem')
+            with open(certfile, 'w', encoding='utf-8') as f:
+                f.write(certdata)
+            with open(keyfile, 'w', encoding='utf-8') as f:
+                f.write(keydata)
+            context.load_cert_chain(certfile, keyfile)
 
     @staticmethod
     def _create_payload(method: str, params: Optional[Union[Dict[str, Any],
-    List[Any]]], call_id: int, version: str) -> str:
+    List[Any]]], call_id: Union[int, str], version: str) -> str:
         """
         Создает JSON-строку для тела запроса.
 
@@ -167,38 +564,534 @@ class HttpTransport(Transport):
         :return: JSON-строка для тела запроса.
         :raises ValueError: Если параметры не являются словарем, списком или None.
         """
-        if not isinstance(params, (dict, list, NoneType)):
+        # Быстрая проверка точного типа для частого случая, isinstance - для подклассов.
+        params_type = type(params)
+        if (params is not None and params_type is not dict and params_type is not list
+                and not isinstance(params, (dict, list))):
             raise ValueError(f'Params "{params}" are invalid')
-        return json.dumps(
-            {
-                'jsonrpc': version,
-                'method': method,
-                'params': params or {},
-                'id': call_id
-            }
-        )
+        template, template_no_params = HttpTransport._payload_templates(version)
+        if params is None:
+            # Спецификация JSON-RPC 2.0 позволяет не передавать params.
+            return template_no_params % (encode_basestring_ascii(method), _json_encoder.encode(call_id))
+        return template % (encode_basestring_ascii(method), _json_encoder.encode(params),
+                           _json_encoder.encode(call_id))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _payload_templates(version: str) -> Tuple[str, str]:
+        """
+        Возвращает шаблоны тела запроса с уже подставленной версией JSON-RPC.
+
+        Версия постоянна для сервера, поэтому кодируется один раз, а при
+        вызове подставляются только метод, параметры и идентификатор.
+
+        :param version: Версия JSON-RPC.
+        :return: Кортеж шаблонов (с параметрами, без параметров).
+        """
+        encoded_version = encode_basestring_ascii(version).replace('%', '%%')
+        return _PAYLOAD_TEMPLATE % encoded_version, _PAYLOAD_TEMPLATE_NO_PARAMS % encoded_version
+
+    @staticmethod
+    def _decompress(data: bytes, encoding: Optional[str]) -> bytes:
+        """
+        Распаковывает тело ответа в соответствии с заголовком Content-Encoding.
+
+        :param data: Тело ответа.
+        :param encoding: Значение заголовка Content-Encoding (опционально).
+        :return: Распакованное тело ответа.
+        """
+        if encoding == 'gzip':
+            return gzip.decompress(data)
+        if encoding == 'deflate':
+            try:
+                return zlib.decompress(data)
+            except zlib.error:
+                # Некоторые серверы отдают deflate без zlib-заголовка.
+                return zlib.decompress(data, -zlib.MAX_WBITS)
+        return data
 
     @staticmethod
     def _create_headers() -> Dict[str, str]:
         """
-        Создает заголовки для HTTP-запроса.
+        Возвращает заголовки для HTTP-запроса.
+
+        :return: Общий словарь с заголовками (не изменяется вызывающим кодом).
+        """
+        return _HEADERS
+
+
+class AsyncHttpTransport(Transport):
+    """
+    Асинхронная реализация транспорта для выполнения JSON-RPC вызовов через HTTP/HTTPS.
+
+    Блокирующий вызов HttpTransport выполняется в собственном пуле потоков
+    транспорта, поэтому событийный цикл не блокируется на сетевом вводе-выводе
+    и может выполнять несколько вызовов конкурентно. Пул потоков не зависит от
+    событийного цикла: под WSGI Django создает новый цикл на каждый запрос, и
+    пул потоков цикла по умолчанию создавался бы заново для каждого вызова.
+    Соединения берутся из пула HttpTransport.
+    """
+
+    def __init__(self, transport: Optional[HttpTransport] = None, max_workers: Optional[int] = None):
+        """
+        Инициализирует асинхронный транспорт.
+
+        :param transport: Синхронный транспорт, выполняющий вызовы (опционально).
+        :param max_workers: Количество потоков для одновременных вызовов (опционально).
+        """
+        self.transport = transport or HttpTransport()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='jrpc')
+
+    async def call(
+            self,
+            scheme: str,
+            host: str,
+            port: int,
+            url: str,
+            method: str,
+            params: Optional[Union[Dict[str, Any], List[Any]]],
+            call_id: int,
+            version: str,
+            certdata: Optional[str] = None,
+            keydata: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Выполняет JSON-RPC вызов через HTTP/HTTPS, не блокируя событийный цикл.
+
+        :param scheme: Протокол (http или https).
+        :param host: Хост сервера.
+        :param port: Порт сервера.
+        :param url: URL-путь для вызова.
+        :param method: Имя метода JSON-RPC.
+        :param params: Параметры метода JSON-RPC (словарь или список).
+        :param call_id: Идентификатор вызова.
+        :param version: Версия JSON-RPC.
+        :param certdata: Данные сертификата в виде строки (опционально).
+        :param keydata: Данные ключа в виде строки (опционально).
+        :return: Ответ от сервера в виде словаря.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.transport.call, scheme, host, port, url,
+            method, params, call_id, version, certdata, keydata)
+
+    async def call_raw(
+            self,
+            scheme: str,
+            host: str,
+            port: int,
+            url: str,
+            method: str,
+            params: Optional[Union[Dict[str, Any], List[Any]]],
+            call_id: int,
+            version: str,
+            certdata: Optional[str] = None,
+            keydata: Optional[str] = None) -> 'StreamedResponse':
+        """
+        Выполняет JSON-RPC вызов через HTTP/HTTPS и возвращает тело ответа без разбора.
+
+        Отправка запроса и чтение первой части ответа выполняются в пуле потоков.
+
+        :param scheme: Протокол (http или https).
+        :param host: Хост сервера.
+        :param port: Порт сервера.
+        :param url: URL-путь для вызова.
+        :param method: Имя метода JSON-RPC.
+        :param params: Параметры метода JSON-RPC (словарь или список).
+        :param call_id: Идентификатор вызова.
+        :param version: Версия JSON-RPC.
+        :param certdata: Данные сертификата в виде строки (опционально).
+        :param keydata: Данные ключа в виде строки (опционально).
+        :return: Ответ, читаемый по частям.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.transport.call_raw, scheme, host, port, url,
+            method, params, call_id, version, certdata, keydata)
+
+    def close(self) -> None:
+        """
+        Останавливает пул потоков и закрывает соединения синхронного транспорта.
+        """
+        self._executor.shutdown(wait=False)
+        self.transport.close()
+
+
+class StreamedResponse:
+    """
+    Ответ JSON-RPC, тело которого читается по частям без разбора.
+
+    Первая часть тела читается сразу, и по ключам верхнего уровня в ней
+    определяется, содержит ли ответ result или error. Если по первой части
+    это определить нельзя, is_error равен None и ответ нужно разобрать целиком.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        """
+        Читает первую часть тела ответа.
+
+        :param chunks: Итератор частей тела ответа.
+        """
+        self._chunks = chunks
+        self.head = next(chunks, b'')
+        self.is_error = self._peek_is_error(self.head)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.head
+        yield from self._chunks
+
+    def read(self) -> bytes:
+        """
+        Читает тело ответа целиком.
+
+        :return: Тело ответа.
+        """
+        return b''.join(self)
+
+    def close(self) -> None:
+        """
+        Прекращает чтение ответа и закрывает недочитанное соединение.
+        """
+        close = getattr(self._chunks, 'close', None)
+        if close is not None:
+            close()
+
+    @staticmethod
+    def _peek_is_error(head: bytes) -> Optional[bool]:
+        """
+        Определяет по началу тела, содержит ли ответ ошибку.
+
+        Ключи верхнего уровня перебираются по порядку; значения до result
+        или error (jsonrpc, id) - короткие скаляры, поэтому обычно решение
+        принимается по первым байтам тела.
+
+        :param head: Начало тела ответа.
+        :return: True для ошибки, False для результата, None если определить нельзя.
+        """
+        try:
+            text = head.decode('utf-8')
+        except UnicodeDecodeError as e:
+            # Граница части может разрезать многобайтовый символ.
+            text = head[:e.start].decode('utf-8')
+        try:
+            pos = _WHITESPACE.match(text, 0).end()
+            if text[pos:pos + 1] != '{':
+                return None
+            while True:
+                pos = _WHITESPACE.match(text, pos + 1).end()
+                if text[pos:pos + 1] != '"':
+                    return None
+                key, pos = scanstring(text, pos + 1)
+                pos = _WHITESPACE.match(text, pos).end()
+                if text[pos:pos + 1] != ':':
+                    return None
+                if key == 'result':
+                    return False
+                if key == 'error':
+                    return True
+                _, pos = _json_decoder.raw_decode(text, _WHITESPACE.match(text, pos + 1).end())
+                pos = _WHITESPACE.match(text, pos).end()
+                if text[pos:pos + 1] != ',':
+                    return None
+        except ValueError:
+            return None
+
+
+class WebSocketConnection:
+    """
+    Постоянное WebSocket соединение (RFC 6455) для JSON-RPC вызовов.
+
+    Ответы читаются фоновым потоком и передаются ожидающим вызовам по
+    идентификатору, поэтому несколько вызовов могут выполняться по одному
+    соединению одновременно.
+    """
+
+    def __init__(self,
+                 scheme: str,
+                 host: str,
+                 port: Optional[int],
+                 url: str,
+                 certdata: Optional[str] = None,
+                 keydata: Optional[str] = None,
+                 timeout: Optional[float] = None):
+        """
+        Открывает соединение и выполняет WebSocket рукопожатие.
+
+        :param scheme: Протокол (ws или wss).
+        :param host: Хост сервера.
+        :param port: Порт сервера (опционально).
+        :param url: URL-путь для подключения.
+        :param certdata: Данные сертификата в виде строки (опционально).
+        :param keydata: Данные ключа в виде строки (опционально).
+        :param timeout: Время ожидания подключения и рукопожатия в секундах (опционально).
+        :raises ConnectionError: Если сервер не подтвердил рукопожатие.
+        :raises TimeoutError: Если подключение или рукопожатие не завершились за timeout.
+        """
+        default_port = 443 if scheme == "wss" else 80
+        sock = socket.create_connection((host, port or default_port), timeout)
+        try:
+            if scheme == "wss":
+                context = HttpTransport._create_ssl_context(certdata, keydata)
+                sock = context.wrap_socket(sock, server_hostname=host)
+        except Exception:
+            sock.close()
+            raise
+        self._sock = sock
+        self._rfile = sock.makefile('rb')
+        self._send_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Future] = {}
+        self.closed = False
+        try:
+            self._handshake(host if port in (None, default_port) else f'{host}:{port}', url or '/')
+        except Exception:
+            self._rfile.close()
+            self._sock.close()
+            raise
+        # Ожидание ответов ограничивается в request, поток чтения блокируется без ограничения.
+        sock.settimeout(None)
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+
+    def request(self, request_id: int, payload: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Отправляет JSON-RPC запрос и ожидает ответ с тем же идентификатором.
+
+        :param request_id: Идентификатор запроса, уникальный в пределах соединения.
+        :param payload: JSON-строка запроса.
+        :param timeout: Время ожидания ответа в секундах (опционально).
+        :return: Ответ от сервера.
+        :raises ConnectionError: Если соединение закрыто.
+        """
+        future = Future()
+        with self._lock:
+            if self.closed:
+                raise ConnectionError('WebSocket connection is closed')
+            self._pending[request_id] = future
+        try:
+            self._send_frame(_WS_OPCODE_TEXT, payload.encode('utf-8'))
+            return future.result(timeout)
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
+
+    def close(self) -> None:
+        """
+        Закрывает соединение.
+        """
+        if not self.closed:
+            try:
+                self._send_frame(_WS_OPCODE_CLOSE, b'')
+            except OSError:
+                pass
+        self._fail_pending(ConnectionError('WebSocket connection is closed'))
+        self._close_socket()
+
+    def _close_socket(self) -> None:
+        """
+        Закрывает сокет соединения; повторный вызов ничего не делает.
+        """
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._rfile.close()
+        self._sock.close()
+
+    def _handshake(self, host: str, url: str) -> None:
+        """
+        Выполняет WebSocket рукопожатие и проверяет ответ сервера.
+
+        :param host: Значение заголовка Host.
+        :param url: URL-путь для подключения.
+        :raises ConnectionError: Если сервер не подтвердил рукопожатие.
+        """
+        key = base64.b64encode(os.urandom(16)).decode('ascii')
+        self._sock.sendall((
+            f'GET {url} HTTP/1.1\r\n'
+            f'Host: {host}\r\n'
+            'Upgrade: websocket\r\n'
+            'Connection: Upgrade\r\n'
+            f'Sec-WebSocket-Key: {key}\r\n'
+            'Sec-WebSocket-Version: 13\r\n\r\n'
+        ).encode('ascii'))
+        status = self._rfile.readline().decode('latin-1')
+        headers = {}
+        while True:
+            line = self._rfile.readline().decode('latin-1').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        accept = base64.b64encode(hashlib.sha1((key + _WS_GUID).encode('ascii')).digest()).decode('ascii')
+        if status.split(' ', 2)[1:2] != ['101'] or headers.get('sec-websocket-accept') != accept:
+            raise ConnectionError(f'WebSocket handshake failed: "{status.strip()}"')
+
+    def _send_frame(self, opcode: int, data: bytes) -> None:
+        """
+        Отправляет замаскированный кадр (клиент обязан маскировать кадры).
+
+        :param opcode: Код операции кадра.
+        :param data: Данные кадра.
+        """
+        length = len(data)
+        if length < 126:
+            header = struct.pack('!BB', 0x80 | opcode, 0x80 | length)
+        elif length < 65536:
+            header = struct.pack('!BBH', 0x80 | opcode, 0x80 | 126, length)
+        else:
+            header = struct.pack('!BBQ', 0x80 | opcode, 0x80 | 127, length)
+        mask = os.urandom(4)
+        with self._send_lock:
+            self._sock.sendall(header + mask + self._mask(data, mask))
+
+    def _read_frame(self) -> Tuple[bool, int, bytes]:
+        """
+        Читает один кадр из соединения.
+
+        :return: Кортеж (признак последнего фрагмента, код операции, данные).
+        """
+        first, second = self._read_exact(2)
+        length = second & 0x7F
+        if length == 126:
+            length, = struct.unpack('!H', self._read_exact(2))
+        elif length == 127:
+            length, = struct.unpack('!Q', self._read_exact(8))
+        mask = self._read_exact(4) if second & 0x80 else None
+        data = self._read_exact(length)
+        if mask:
+            data = self._mask(data, mask)
+        return bool(first & 0x80), first & 0x0F, data
+
+    def _read_exact(self, size: int) -> bytes:
+        """
+        Читает ровно size байт из соединения.
+
+        :param size: Количество байт.
+        :return: Прочитанные данные.
+        :raises ConnectionError: Если соединение закрыто сервером.
+        """
+        data = self._rfile.read(size)
+        if len(data) < size:
+            raise ConnectionError('WebSocket connection closed by server')
+        return data
+
+    def _read_loop(self) -> None:
+        """
+        Читает сообщения и передает ответы ожидающим вызовам по идентификатору.
+        """
+        error = ConnectionError('WebSocket connection closed by server')
+        message = b''
+        try:
+            while True:
+                fin, opcode, data = self._read_frame()
+                if opcode == _WS_OPCODE_CLOSE:
+                    # Завершение рукопожатия закрытия: сервер ждет ответный кадр с тем же кодом.
+                    with self._lock:
+                        self.closed = True
+                    self._send_frame(_WS_OPCODE_CLOSE, data[:2])
+                    break
+                if opcode == _WS_OPCODE_PING:
+                    self._send_frame(_WS_OPCODE_PONG, data)
+                    continue
+                if opcode == _WS_OPCODE_PONG:
+                    continue
+                message += data
+                if fin:
+                    self._dispatch(json.loads(message))
+                    message = b''
+        except (OSError, ValueError) as e:
+            error = e if isinstance(e, ConnectionError) else ConnectionError(str(e))
+        self._fail_pending(error)
+        # Соединение больше не используется, поэтому сокет закрывается сразу,
+        # а не остается открытым до замены соединения в транспорте.
+        self._close_socket()
+
+    def _dispatch(self, response: Dict[str, Any]) -> None:
+        """
+        Передает ответ вызову, ожидающему его идентификатор.
+
+        Ответ с "id": null (ошибка разбора или неверный запрос) нельзя отнести
+        к конкретному вызову. Он передается вызову, только если тот ожидает
+        ответа один; иначе ответ пропускается, а вызов, которому он
+        предназначался, завершается по истечении времени ожидания.
+
+        :param response: Ответ сервера.
+        """
+        if not isinstance(response, dict):
+            # Транспорт не отправляет пакетов, поэтому другой ответ не может предназначаться вызову.
+            logger.warning('Dropped unexpected WebSocket message: %s', response)
+            return
+        request_id = response.get('id')
+        with self._lock:
+            if request_id is not None:
+                future = self._pending.get(request_id)
+            elif len(self._pending) == 1:
+                future, = self._pending.values()
+            else:
+                future = None
+                logger.warning('Dropped WebSocket response with "id": null, %d calls pending: %s',
+                               len(self._pending), response)
+        if future is not None and not future.done():
+            future.set_result(response)
+
+    def _fail_pending(self, error: Exception) -> None:
+        """
+        Помечает соединение закрытым и завершает ожидающие вызовы ошибкой.
+
+        :param error: Исключение для ожидающих вызовов.
+        """
+        with self._lock:
+            self.closed = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    @staticmethod
+    def _mask(data: bytes, mask: bytes) -> bytes:
+        """
+        Применяет (или снимает) маску к данным кадра.
 
-        :return: Словарь с заголовками.
+        :param data: Данные кадра.
+        :param mask: Четырехбайтовая маска.
+        :return: Замаскированные данные.
         """
-        return {"Content-Type": "application/json"}
+        length = len(data)
+        key = (mask * (length // 4 + 1))[:length]
+        return (int.from_bytes(data, 'big') ^ int.from_bytes(key, 'big')).to_bytes(length, 'big')
 
 
 class WebSocketTransport(Transport):
     """
-    Реализация транспорта для выполнения JSON-RPC вызовов через WebSocket (заглушка).
+    Реализация транспорта для выполнения JSON-RPC вызовов через WebSocket.
+
+    На каждую пару (адрес, сертификат) открывается одно постоянное
+    соединение, по которому конкурентные вызовы выполняются одновременно.
+    Идентификаторы вызовов на проводе заменяются уникальными, поэтому
+    одинаковые call_id из разных потоков не конфликтуют.
     """
 
+    def __init__(self, timeout: Optional[float] = 30.0):
+        """
+        Инициализирует транспорт.
+
+        :param timeout: Время ожидания подключения и ответа в секундах (None - ждать без ограничения).
+        """
+        self.timeout = timeout
+        self._connections: Dict[Tuple[str, str, Optional[int], str, Optional[str], Optional[str]],
+                                WebSocketConnection] = {}
+        self._lock = threading.Lock()
+        # Подключение выполняется под блокировкой своего ключа, а не общей блокировкой,
+        # поэтому медленный сервер не задерживает вызовы к другим серверам.
+        self._connect_locks: Dict[Tuple[str, str, Optional[int], str, Optional[str], Optional[str]],
+                                  threading.Lock] = {}
+        self._ids = itertools.count(1)
+
     def call(self, scheme: str, host: str, port: int,
              url: str, method: str, params: Optional[Union[Dict[str, Any], List[Any]]],
              call_id: int, version: str,
-             certfile: Optional[str] = None, keyfile: Optional[str] = None) -> Dict[str, Any]:
+             certdata: Optional[str] = None, keydata: Optional[str] = None) -> Dict[str, Any]:
         """
-        Выполняет JSON-RPC вызов через WebSocket (заглушка).
+        Выполняет JSON-RPC вызов через WebSocket.
 
         :param scheme: Протокол (ws или wss).
         :param host: Хост.
@@ -208,12 +1101,63 @@ class WebSocketTransport(Transport):
         :param params: Параметры метода JSON-RPC (словарь или список).
         :param call_id: Идентификатор вызова.
         :param version: Версия JSON-RPC.
-        :param certfile: Путь к файлу сертификата (опционально).
-        :param keyfile: Путь к файлу ключа (опционально).
+        :param certdata: Данные сертификата в виде строки (опционально).
+        :param keydata: Данные ключа в виде строки (опционально).
         :return: Ответ от сервера в виде словаря.
+        :raises ValueError: Если схема не поддерживается.
+        """
+        if scheme not in _SUPPORTED_WS_SCHEMES:
+            raise ValueError(f'Scheme "{scheme}" is not supported. Use "ws" or "wss".')
+        conn = self._get_connection((scheme, host, port, url, certdata, keydata))
+        request_id = next(self._ids)
+        payload = HttpTransport._create_payload(method, params, request_id, version)
+        response = conn.request(request_id, payload, self.timeout)
+        response['id'] = call_id
+        return response
+
+    def close(self) -> None:
+        """
+        Закрывает все открытые соединения.
+        """
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+
+    def __enter__(self) -> 'WebSocketTransport':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _get_connection(
+            self,
+            key: Tuple[str, str, Optional[int], str, Optional[str], Optional[str]]
+    ) -> WebSocketConnection:
         """
-        print(f"WebSocket call to {scheme}://{host}:{port}")
-        return {"jsonrpc": "2.0", "result": "pong", "id": 1}
+        Возвращает открытое соединение для ключа или открывает новое.
+
+        :param key: Ключ соединения (схема, хост, порт, путь, сертификат, ключ).
+        :return: WebSocket соединение.
+        """
+        with self._lock:
+            conn = self._connections.get(key)
+            if conn is not None and not conn.closed:
+                return conn
+            connect_lock = self._connect_locks.setdefault(key, threading.Lock())
+        with connect_lock:
+            with self._lock:
+                conn = self._connections.get(key)
+                if conn is not None and not conn.closed:
+                    return conn
+            if conn is not None:
+                # Закрытое соединение могло еще не освободить сокет.
+                conn.close()
+            conn = WebSocketConnection(*key, timeout=self.timeout)
+            with self._lock:
+                self._connections[key] = conn
+            return conn
 
 
 class UrlParser:
@@ -281,11 +1225,62 @@ class VersionValidator:
         :return: Валидная версия JSON-RPC.
         :raises ValueError: Если версия не поддерживается.
         """
-        if version not in ('2.0',):
+        if version not in _SUPPORTED_VERSIONS:
             raise ValueError(f'Version "{version}" is not supported')
         return version
 
 
+class BatchBuilder:
+    """
+    Накопитель JSON-RPC вызовов для отправки одним пакетным запросом.
+
+    При выходе из контекстного менеджера без исключения накопленные вызовы
+    отправляются, а ответы сохраняются в атрибуте results.
+    """
+
+    def __init__(self, server: 'JrpcServer'):
+        """
+        Инициализирует накопитель вызовов.
+
+        :param server: JSON-RPC сервер, на котором выполняется пакет.
+        """
+        self.server = server
+        self.calls: List[Tuple[str, Optional[Union[Dict[str, Any], List[Any]]], int]] = []
+        self.results: Optional[List[Dict[str, Any]]] = None
+
+    def add(self, method: str, params: Optional[Union[Dict[str, Any],
+    List[Any]]] = None, call_id: Optional[int] = None) -> int:
+        """
+        Добавляет вызов в пакет.
+
+        :param method: Имя метода JSON-RPC.
+        :param params: Параметры метода JSON-RPC (словарь или список).
+        :param call_id: Идентификатор вызова (по умолчанию порядковый номер в пакете).
+        :return: Идентификатор вызова.
+        """
+        if call_id is None:
+            call_id = len(self.calls) + 1
+        self.calls.append((method, params, call_id))
+        return call_id
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """
+        Отправляет накопленные вызовы и очищает пакет.
+
+        :return: Список ответов в порядке добавления вызовов.
+        """
+        calls, self.calls = self.calls, []
+        self.results = self.server.call_batch(calls) if calls else []
+        return self.results
+
+    def __enter__(self) -> 'BatchBuilder':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+
 class JrpcServer:
     """
     Класс для выполнения JSON-RPC вызовов на сервере.
@@ -304,11 +1299,28 @@ class JrpcServer:
         :param keyfile: Путь к файлу ключа (опционально).
         """
         self.url_parser = UrlParser(url)
+        # Части URL не меняются, поэтому разбираются один раз, а не при каждом вызове.
+        self.endpoint = (self.url_parser.scheme, self.url_parser.host,
+                         self.url_parser.port, self.url_parser.path)
         self.version = VersionValidator.validate(version)
         self.transport = transport
+        # Асинхронный транспорт возвращает корутины, которые синхронные методы не ожидают.
+        self.is_async = asyncio.iscoroutinefunction(transport.call)
         self.certfile = certfile
         self.keyfile = keyfile
 
+    def _check_transport(self, is_async: bool) -> None:
+        """
+        Проверяет, что вид транспорта подходит вызываемому методу.
+
+        :param is_async: Требуется ли асинхронный транспорт.
+        :raises TypeError: Если транспорт не подходит методу.
+        """
+        if self.is_async is not is_async:
+            if is_async:
+                raise TypeError(f'{type(self.transport).__name__} is synchronous, use call_* methods')
+            raise TypeError(f'{type(self.transport).__name__} is asynchronous, use acall_* methods')
+
     def call_method(self, method: str, params: Optional[Union[Dict[str, Any],
     List[Any]]] = None, call_id: int = 1) -> Dict[str, Any]:
         """
@@ -318,18 +1330,121 @@ class JrpcServer:
         :param params: Параметры метода JSON-RPC (словарь или список).
         :param call_id: Идентификатор вызова.
         :return: Ответ от сервера в виде словаря.
+        :raises TypeError: Если транспорт асинхронный.
+        """
+        self._check_transport(False)
+        return self.transport.call(*self.endpoint, method, params, call_id,
+                                   self.version, self.certfile, self.keyfile)
+
+    def call_method_raw(self, method: str, params: Optional[Union[Dict[str, Any],
+    List[Any]]] = None, call_id: int = 1) -> StreamedResponse:
         """
-        scheme = self.url_parser.scheme
-        host = self.url_parser.host
-        port = self.url_parser.port
-        url = self.url_parser.path
-        version = self.version
-        return self.transport.call(scheme, host, port, url,
-                                   method, params, call_id, version,
-                                   self.certfile, self.keyfile)
+        Выполняет JSON-RPC вызов на сервере и возвращает тело ответа без разбора.
+
+        :param method: Имя метода JSON-RPC.
+        :param params: Параметры метода JSON-RPC (словарь или список).
+        :param call_id: Идентификатор вызова.
+        :return: Ответ, читаемый по частям.
+        :raises TypeError: Если транспорт асинхронный.
+        """
+        self._check_transport(False)
+        return self.transport.call_raw(*self.endpoint, method, params, call_id,
+                                       self.version, self.certfile, self.keyfile)
+
+    def call_batch(self, calls: List[Tuple[str, Optional[Union[Dict[str, Any], List[Any]]], int]]
+                   ) -> List[Dict[str, Any]]:
+        """
+        Выполняет пакет JSON-RPC вызовов одним запросом.
+
+        Сервер может вернуть ответы в произвольном порядке, поэтому они
+        сопоставляются с вызовами по идентификатору. Ошибка одного вызова
+        не влияет на остальные: каждый ответ содержит свой result или error.
+
+        :param calls: Список вызовов (имя метода, параметры, идентификатор вызова).
+        :return: Список ответов в порядке вызовов.
+        :raises ValueError: Если идентификаторы вызовов повторяются.
+        :raises TypeError: Если транспорт асинхронный.
+        """
+        self._check_transport(False)
+        call_ids = [call_id for _, _, call_id in calls]
+        if len(set(call_ids)) != len(call_ids):
+            raise ValueError('Batch call ids must be unique')
+        response = self.transport.call_batch(*self.endpoint, calls, self.version,
+                                             self.certfile, self.keyfile)
+        if isinstance(response, dict):
+            # Сервер отклонил пакет целиком и вернул одну ошибку.
+            return [response] * len(calls)
+        responses = {item.get('id'): item for item in response}
+        return [responses.get(call_id, {
+            'jsonrpc': self.version,
+            'error': {'code': -32603, 'message': 'No response for call in batch'},
+            'id': call_id
+        }) for call_id in call_ids]
+
+    def call_many(self, calls: Iterable[Tuple[str, Optional[Union[Dict[str, Any], List[Any]]], int]],
+                  max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Выполняет несколько JSON-RPC вызовов параллельно в пуле потоков.
+
+        В отличие от call_batch, не требует поддержки пакетов на сервере:
+        каждый вызов отправляется отдельным запросом по соединению из пула.
+
+        :param calls: Вызовы (имя метода, параметры, идентификатор вызова).
+        :param max_workers: Количество потоков (по умолчанию не более 8).
+        :return: Список ответов в порядке вызовов.
+        :raises TypeError: Если транспорт асинхронный.
+        """
+        self._check_transport(False)
+        calls = list(calls)
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers or min(8, len(calls))) as executor:
+            return list(executor.map(lambda call: self.call_method(*call), calls))
+
+    def batch(self) -> BatchBuilder:
+        """
+        Создает накопитель вызовов для пакетного запроса.
+
+        :return: Накопитель вызовов, связанный с этим сервером.
+        """
+        return BatchBuilder(self)
+
+    async def acall_method(self, method: str, params: Optional[Union[Dict[str, Any],
+    List[Any]]] = None, call_id: int = 1) -> Dict[str, Any]:
+        """
+        Выполняет JSON-RPC вызов на сервере через асинхронный транспорт.
+
+        :param method: Имя метода JSON-RPC.
+        :param params: Параметры метода JSON-RPC (словарь или список).
+        :param call_id: Идентификатор вызова.
+        :return: Ответ от сервера в виде словаря.
+        :raises TypeError: Если транспорт синхронный.
+        """
+        self._check_transport(True)
+        return await self.transport.call(*self.endpoint, method, params, call_id,
+                                         self.version, self.certfile, self.keyfile)
+
+    async def acall_method_raw(self, method: str, params: Optional[Union[Dict[str, Any],
+    List[Any]]] = None, call_id: int = 1) -> StreamedResponse:
+        """
+        Выполняет JSON-RPC вызов через асинхронный транспорт и возвращает тело ответа без разбора.
+
+        :param method: Имя метода JSON-RPC.
+        :param params: Параметры метода JSON-RPC (словарь или список).
+        :param call_id: Идентификатор вызова.
+        :return: Ответ, читаемый по частям.
+        :raises TypeError: Если транспорт синхронный.
+        """
+        self._check_transport(True)
+        return await self.transport.call_raw(*self.endpoint, method, params, call_id,
+                                             self.version, self.certfile, self.keyfile)
 
 
 http_transport = HttpTransport()
+async_http_transport = AsyncHttpTransport(http_transport)
 websocket_transport = WebSocketTransport()
 
-__all__ = ['JrpcServer', 'http_transport', 'websocket_transport']
+atexit.register(async_http_transport.close)
+atexit.register(websocket_transport.close)
+
+__all__ = ['JrpcServer', 'BatchBuilder', 'StreamedResponse', 'http_transport', 'async_http_transport', 'websocket_transport']
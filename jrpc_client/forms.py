@@ -1,5 +1,4 @@
 import json
-from types import NoneType
 
 from django import forms
 from django.core.exceptions import ValidationError
@@ -10,12 +9,19 @@ class JrpcClientForm(forms.Form):
     params = forms.CharField(label="Параметры", widget=forms.Textarea, max_length=1000, required=False)
 
     def clean_params(self):
+        """
+        Проверяет и разбирает параметры за один проход.
+
+        :return: Разобранные параметры (словарь или список) или None, если параметры не заданы.
+        """
         params = self.cleaned_data.get('params')
-        if params:
-            try:
-                json_params = json.loads(params)
-                if not isinstance(json_params, (dict, list, NoneType)):
-                    raise ValidationError(f'Params "{params}" are invalids')
-            except json.JSONDecodeError:
-                raise ValidationError("Params must be a JSON format.")
-        return params
+        if not params:
+            return None
+        # Верхний уровень params - объект или массив, поэтому строку с другим
+        # первым символом отклоняем без полного разбора JSON.
+        if params[0] not in '{[' and params != 'null':
+            raise ValidationError(f'Params "{params}" are invalids')
+        try:
+            return json.loads(params)
+        except json.JSONDecodeError:
+            raise ValidationError("Params must be a JSON format.")
@@ -1,9 +1,22 @@
+import base64
+import gzip
+import hashlib
+import http.client
 import json
+import os
+import socket
+import threading
 import unittest
-from unittest.mock import patch, MagicMock
+import zlib
+from unittest.mock import patch, MagicMock, AsyncMock
+from asgiref.sync import async_to_sync
+from django.conf import settings
 from django.test import TestCase, RequestFactory
 from django.urls import reverse
-from .client import JrpcServer, http_transport
+from .client import (JrpcServer, HttpTransport, AsyncHttpTransport, WebSocketTransport,
+                     StreamedResponse, _DEFAULT_SSL_CONTEXT)
+from .cache import TtlLruCache
+from .forms import JrpcClientForm
 from .views import JrpcClientView
 
 
@@ -20,6 +33,9 @@ class JrpcClientViewTests(TestCase):
         self.factory = RequestFactory()
         self.url = reverse('jrpc_client')
         self.view: JrpcClientView = JrpcClientView()
+        # Сервер кэшируется на классе представления и не должен переживать тест.
+        self.addCleanup(lambda: JrpcClientView.__dict__.get('_server_instance')
+                        and delattr(JrpcClientView, '_server_instance'))
 
     def test_get_request(self) -> None:
         """
@@ -53,13 +69,13 @@ class JrpcClientViewTests(TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertIn('params', response.json())
 
-    @patch('jrpc_client.views.JrpcServer.call_method')
-    def test_post_method_success(self, mock_jrpc_call: MagicMock) -> None:
+    @patch('jrpc_client.client.JrpcServer.acall_method')
+    def test_post_method_success(self, mock_jrpc_call: AsyncMock) -> None:
         """
         Тестирует успешный вызов jsonrpc метода через POST запрос.
 
         Args:
-            mock_jrpc_call (MagicMock): Мок объекта вызова jsonrpc метода.
+            mock_jrpc_call (AsyncMock): Мок объекта вызова jsonrpc метода.
         """
         mock_jrpc_call.return_value = {
             'result': {
@@ -72,13 +88,228 @@ class JrpcClientViewTests(TestCase):
         }
         data = {'method': 'auth.check', 'params': ''}
         request = self.factory.post(self.url, data=data)
-        response = self.view.post(request)
+        response = async_to_sync(self.view.post)(request)
         json_response = json.loads(response.content.decode('utf-8'))
         user_data = json_response['result']['_data']['user']
         self.assertEqual(response.status_code, 200)
         self.assertIn('result', json_response)
         self.assertEqual(user_data['id'], 1)
 
+    @patch('jrpc_client.client.JrpcServer.acall_method')
+    def test_post_method_jrpc_error(self, mock_jrpc_call: AsyncMock) -> None:
+        """
+        Тестирует ответ на ошибку, возвращенную jsonrpc сервисом.
+
+        Args:
+            mock_jrpc_call (AsyncMock): Мок объекта вызова jsonrpc метода.
+        """
+        mock_jrpc_call.return_value = {'error': {'code': -32601, 'message': 'Method not found'}}
+        with self.assertLogs('jrpc_client.views', level='ERROR') as logs:
+            response = self.client.post(self.url, data={'method': 'unknown', 'params': ''})
+        self.assertEqual(logs.records[0].funcName, 'post')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json(),
+                         {'error': 'Method not found: The method does not exist or is not available.'})
+
+    @patch('jrpc_client.client.JrpcServer.acall_method')
+    def test_post_cached_method(self, mock_jrpc_call: AsyncMock) -> None:
+        """
+        Тестирует кэширование ответов методов только для чтения.
+
+        Args:
+            mock_jrpc_call (AsyncMock): Мок объекта вызова jsonrpc метода.
+        """
+        mock_jrpc_call.return_value = {'result': 'pong'}
+        data = {'method': 'ping', 'params': '{"b": 1, "a": 2}'}
+        with patch.object(JrpcClientView, 'jrpc_cached_methods', frozenset({'ping'})), \
+                patch.object(JrpcClientView, 'jrpc_cache', TtlLruCache()):
+            first = self.client.post(self.url, data=data)
+            second = self.client.post(self.url, data={'method': 'ping', 'params': '{"a": 2, "b": 1}'})
+        self.assertEqual(first.json(), second.json())
+        mock_jrpc_call.assert_awaited_once()
+
+    @patch('jrpc_client.client.JrpcServer.acall_method_raw')
+    def test_post_streamed_response(self, mock_jrpc_call: AsyncMock) -> None:
+        """
+        Тестирует потоковую передачу успешного ответа без повторного кодирования.
+
+        Args:
+            mock_jrpc_call (AsyncMock): Мок объекта вызова jsonrpc метода.
+        """
+        mock_jrpc_call.return_value = StreamedResponse(iter([b'{"jsonrpc": "2.0", "result": ', b'[1, 2], "id": 1}']))
+        with patch.object(JrpcClientView, 'jrpc_stream_responses', True):
+            response = self.client.post(self.url, data={'method': 'list', 'params': ''})
+        self.assertTrue(response.streaming)
+        self.assertEqual(json.loads(b''.join(response.streaming_content))['result'], [1, 2])
+
+    @patch('jrpc_client.client.JrpcServer.acall_method_raw')
+    def test_post_streamed_error_response(self, mock_jrpc_call: AsyncMock) -> None:
+        """
+        Тестирует обработку ошибки при потоковом режиме.
+
+        Args:
+            mock_jrpc_call (AsyncMock): Мок объекта вызова jsonrpc метода.
+        """
+        mock_jrpc_call.return_value = StreamedResponse(iter([b'{"error": {"code": -32601}, "id": 1}']))
+        with patch.object(JrpcClientView, 'jrpc_stream_responses', True), \
+                self.assertLogs('jrpc_client.views', level='ERROR'):
+            response = self.client.post(self.url, data={'method': 'unknown', 'params': ''})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Method not found', response.json()['error'])
+
+    @patch('jrpc_client.client.JrpcServer.acall_method')
+    def test_post_method_unexpected_error(self, mock_jrpc_call: AsyncMock) -> None:
+        """
+        Тестирует ответ на непредвиденную ошибку при вызове jsonrpc метода.
+
+        Args:
+            mock_jrpc_call (AsyncMock): Мок объекта вызова jsonrpc метода.
+        """
+        mock_jrpc_call.side_effect = ConnectionError('Connection refused')
+        with self.assertLogs('jrpc_client.views', level='ERROR'):
+            response = self.client.post(self.url, data={'method': 'ping', 'params': ''})
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json(), {'error': 'Internal Server Error'})
+
+    @patch('jrpc_client.client.JrpcServer.acall_method')
+    def test_post_cache_isolated_by_endpoint(self, mock_jrpc_call: AsyncMock) -> None:
+        """
+        Тестирует, что подкласс с другим адресом сервиса не получает ответы из кэша родителя.
+
+        Args:
+            mock_jrpc_call (AsyncMock): Мок объекта вызова jsonrpc метода.
+        """
+        class OtherEndpointView(JrpcClientView):
+            jrpc_url = "https://other.example.com/api/"
+
+        mock_jrpc_call.return_value = {'result': 'pong'}
+        request_data = {'method': 'ping', 'params': ''}
+        with patch.object(JrpcClientView, 'jrpc_cached_methods', frozenset({'ping'})), \
+                patch.object(JrpcClientView, 'jrpc_cache', TtlLruCache()):
+            async_to_sync(JrpcClientView().post)(self.factory.post(self.url, data=request_data))
+            async_to_sync(OtherEndpointView().post)(self.factory.post(self.url, data=request_data))
+        self.assertEqual(mock_jrpc_call.await_count, 2)
+
+    @patch('jrpc_client.client.JrpcServer.acall_method')
+    def test_post_cache_skips_large_body(self, mock_jrpc_call: AsyncMock) -> None:
+        """
+        Тестирует, что ответы больше допустимого размера не кэшируются.
+
+        Args:
+            mock_jrpc_call (AsyncMock): Мок объекта вызова jsonrpc метода.
+        """
+        mock_jrpc_call.return_value = {'result': 'x' * 100}
+        cache = TtlLruCache()
+        with patch.object(JrpcClientView, 'jrpc_cached_methods', frozenset({'ping'})), \
+                patch.object(JrpcClientView, 'jrpc_cache', cache), \
+                patch.object(JrpcClientView, 'jrpc_cache_max_body_size', 10):
+            self.client.post(self.url, data={'method': 'ping', 'params': ''})
+        self.assertEqual(len(cache), 0)
+
+    def test_server_reused(self) -> None:
+        """
+        Тестирует повторное использование JSON-RPC сервера между запросами.
+        """
+        server = JrpcClientView._get_server()
+        self.assertIs(JrpcClientView._get_server(), server)
+        self.assertEqual(server.certfile, settings.JRPC_CERT)
+
+    def test_decode_jrpc_error(self) -> None:
+        """
+        Тестирует расшифровку стандартных, серверных и неизвестных кодов ошибок.
+        """
+        decode = JrpcClientView._decode_jrpc_error
+        self.assertEqual(decode({'code': -32700}), "Parse error: Invalid JSON was received by the server.")
+        self.assertIs(decode({'code': -32601}), decode({'code': -32601, 'message': 'Other'}))
+        self.assertEqual(decode({'code': -32050, 'message': 'Busy', 'data': 'retry'}),
+                         "Server error: Busy. Details: retry")
+        self.assertEqual(decode({'code': 42, 'message': 'Oops'}), "Unknown error: Oops. Details: {}")
+
+    @patch('jrpc_client.client.JrpcServer.acall_method')
+    def test_post_method_params_passed_parsed(self, mock_jrpc_call: AsyncMock) -> None:
+        """
+        Тестирует передачу разобранных формой параметров в вызов jsonrpc метода.
+
+        Args:
+            mock_jrpc_call (AsyncMock): Мок объекта вызова jsonrpc метода.
+        """
+        mock_jrpc_call.return_value = {'result': 'pong'}
+        response = self.client.post(self.url, data={'method': 'ping', 'params': '[1, 2]'})
+        self.assertEqual(response.status_code, 200)
+        mock_jrpc_call.assert_awaited_once_with('ping', [1, 2])
+
+    @patch('jrpc_client.client.JrpcServer.call_method')
+    def test_post_sync_transport(self, mock_jrpc_call: MagicMock) -> None:
+        """
+        Тестирует вызов через синхронный транспорт, выполняемый в пуле потоков.
+
+        Args:
+            mock_jrpc_call (MagicMock): Мок объекта вызова jsonrpc метода.
+        """
+        from .client import http_transport
+        mock_jrpc_call.return_value = {'result': 'pong'}
+        with patch.object(JrpcClientView, 'jrpc_transport', http_transport):
+            response = self.client.post(self.url, data={'method': 'ping', 'params': ''})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'result': 'pong'})
+        mock_jrpc_call.assert_called_once_with('ping', None)
+
+
+class JrpcClientFormTests(TestCase):
+    """
+    Тесты для формы JrpcClientForm.
+    """
+
+    def test_params_parsed_once(self) -> None:
+        """
+        Тестирование сохранения разобранных параметров в форме.
+        """
+        form = JrpcClientForm({'method': 'ping', 'params': '{"param": "value"}'})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['params'], {"param": "value"})
+
+    def test_params_invalid_top_level(self) -> None:
+        """
+        Тестирование отклонения параметров, не являющихся объектом или массивом.
+        """
+        for params in ('123', '"text"', 'true'):
+            form = JrpcClientForm({'method': 'ping', 'params': params})
+            self.assertFalse(form.is_valid())
+            self.assertIn('params', form.errors)
+
+
+class TtlLruCacheTests(unittest.TestCase):
+    """
+    Тесты для кэша TtlLruCache.
+    """
+
+    def test_lru_eviction(self) -> None:
+        """
+        Тестирование вытеснения давно использованной записи.
+        """
+        cache = TtlLruCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEqual((cache.get('a'), cache.get('b'), cache.get('c')), (1, None, 3))
+
+    @patch('jrpc_client.cache.time.monotonic')
+    def test_ttl_expiration(self, mock_monotonic: MagicMock) -> None:
+        """
+        Тестирование устаревания записи.
+
+        Args:
+            mock_monotonic (MagicMock): Мок часов.
+        """
+        mock_monotonic.return_value = 0
+        cache = TtlLruCache(ttl=10)
+        cache.set('a', 1)
+        mock_monotonic.return_value = 10
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+
 
 class TestJrpcServer(unittest.TestCase):
     """
@@ -92,7 +323,7 @@ class TestJrpcServer(unittest.TestCase):
         self.http_url = "http://example.com/api"
         self.https_url = "https://example.com/api"
         self.version = "2.0"
-        self.http_transport = http_transport
+        self.http_transport = HttpTransport()
 
     @patch('http.client.HTTPConnection')
     def test_http_call_method(self, mock_http_conn: MagicMock) -> None:
@@ -114,8 +345,8 @@ class TestJrpcServer(unittest.TestCase):
         mock_http_conn.assert_called_once()
         mock_conn.request.assert_called_once_with(
             "POST", "/api",
-            body='{"jsonrpc": "2.0", "method": "test_method", "params": {"param": "value"}, "id": 1}',
-            headers={"Content-Type": "application/json"}
+            body='{"jsonrpc":"2.0","method":"test_method","params":{"param":"value"},"id":1}',
+            headers={"Content-Type": "application/json", "Accept-Encoding": "gzip, deflate"}
         )
 
     @patch('http.client.HTTPSConnection')
@@ -138,10 +369,454 @@ class TestJrpcServer(unittest.TestCase):
         mock_https_conn.assert_called_once()
         mock_conn.request.assert_called_once_with(
             "POST", "/api",
-            body='{"jsonrpc": "2.0", "method": "test_method", "params": {"param": "value"}, "id": 1}',
-            headers={"Content-Type": "application/json"}
+            body='{"jsonrpc":"2.0","method":"test_method","params":{"param":"value"},"id":1}',
+            headers={"Content-Type": "application/json", "Accept-Encoding": "gzip, deflate"}
+        )
+
+    @patch('http.client.HTTPConnection')
+    def test_connection_reused(self, mock_http_conn: MagicMock) -> None:
+        """
+        Тестирование повторного использования соединения между вызовами.
+
+        Args:
+            mock_http_conn (MagicMock): Мок HTTP соединения.
+        """
+        mock_conn = MagicMock(sock=None)
+        mock_http_conn.return_value = mock_conn
+        mock_resp = mock_conn.getresponse.return_value
+        mock_resp.will_close = False
+        mock_resp.read.return_value = b'{"jsonrpc": "2.0", "result": "success", "id": 1}'
+
+        server = JrpcServer(self.http_url, self.version, self.http_transport)
+        server.call_method("test_method")
+        server.call_method("test_method")
+
+        mock_http_conn.assert_called_once()
+        self.assertEqual(mock_conn.request.call_count, 2)
+        mock_conn.close.assert_not_called()
+
+    def test_pool_maxsize(self) -> None:
+        """
+        Тестирование закрытия соединений сверх размера пула.
+        """
+        transport = HttpTransport(pool_maxsize=1)
+        key = ("http", "example.com", None, None, None)
+        first_conn, second_conn = MagicMock(), MagicMock()
+        resp = MagicMock(will_close=False)
+
+        transport._release_connection(key, first_conn, resp)
+        transport._release_connection(key, second_conn, resp)
+
+        first_conn.close.assert_not_called()
+        second_conn.close.assert_called_once()
+        transport.close()
+        first_conn.close.assert_called_once()
+
+    @patch('http.client.HTTPConnection')
+    def test_stale_connection_retried(self, mock_http_conn: MagicMock) -> None:
+        """
+        Тестирование повтора вызова, если сервер закрыл простаивающее соединение.
+
+        Args:
+            mock_http_conn (MagicMock): Мок HTTP соединения.
+        """
+        stale_conn, fresh_conn = MagicMock(sock=None), MagicMock()
+        mock_http_conn.side_effect = [stale_conn, fresh_conn]
+        stale_conn.getresponse.return_value.will_close = False
+        stale_conn.getresponse.return_value.read.return_value = b'{"jsonrpc": "2.0", "result": 1, "id": 1}'
+        fresh_conn.getresponse.return_value.read.return_value = b'{"jsonrpc": "2.0", "result": 2, "id": 1}'
+
+        server = JrpcServer(self.http_url, self.version, self.http_transport)
+        server.call_method("test_method")
+        stale_conn.request.side_effect = http.client.RemoteDisconnected()
+        response = server.call_method("test_method")
+
+        self.assertEqual(response["result"], 2)
+        stale_conn.close.assert_called_once()
+
+    @patch('http.client.HTTPConnection')
+    def test_sent_request_not_retried(self, mock_http_conn: MagicMock) -> None:
+        """
+        Тестирование отказа от повтора, если соединение оборвалось после отправки запроса.
+
+        Args:
+            mock_http_conn (MagicMock): Мок HTTP соединения.
+        """
+        mock_conn = MagicMock(sock=None)
+        mock_http_conn.return_value = mock_conn
+        mock_conn.getresponse.return_value.will_close = False
+        mock_conn.getresponse.return_value.read.return_value = b'{"jsonrpc": "2.0", "result": 1, "id": 1}'
+
+        server = JrpcServer(self.http_url, self.version, self.http_transport)
+        server.call_method("test_method")
+        mock_conn.getresponse.side_effect = http.client.RemoteDisconnected()
+        with self.assertRaises(http.client.RemoteDisconnected):
+            server.call_method("test_method")
+
+        self.assertEqual(mock_conn.request.call_count, 2)
+        mock_http_conn.assert_called_once()
+
+    def test_dropped_idle_connection_skipped(self) -> None:
+        """
+        Тестирование отбрасывания простаивающего соединения, закрытого сервером.
+        """
+        client_sock, server_sock = socket.socketpair()
+        self.addCleanup(client_sock.close)
+        key = ("http", "example.com", None, None, None)
+        alive_conn, dropped_conn = MagicMock(sock=None), MagicMock(sock=client_sock)
+        self.http_transport._connections[key] = [alive_conn, dropped_conn]
+
+        server_sock.close()
+
+        self.assertEqual(self.http_transport._acquire_connection(key), (alive_conn, True))
+        dropped_conn.close.assert_called_once()
+
+    @patch('http.client.HTTPConnection')
+    def test_async_call_method(self, mock_http_conn: MagicMock) -> None:
+        """
+        Тестирование асинхронного вызова метода через HTTP.
+
+        Args:
+            mock_http_conn (MagicMock): Мок HTTP соединения.
+        """
+        mock_conn = MagicMock()
+        mock_http_conn.return_value = mock_conn
+        mock_conn.getresponse.return_value.read.return_value = b'{"jsonrpc": "2.0", "result": "success", "id": 1}'
+
+        server = JrpcServer(self.http_url, self.version, AsyncHttpTransport(self.http_transport))
+
+        response = async_to_sync(server.acall_method)("test_method", {"param": "value"})
+
+        self.assertEqual(response, {"jsonrpc": "2.0", "result": "success", "id": 1})
+        mock_conn.request.assert_called_once()
+
+    def test_transport_kind_checked(self) -> None:
+        """
+        Тестирование отказа синхронных методов на асинхронном транспорте и наоборот.
+        """
+        async_server = JrpcServer(self.http_url, self.version, AsyncHttpTransport(self.http_transport))
+        with self.assertRaises(TypeError):
+            async_server.call_method("test_method")
+        with self.assertRaises(TypeError):
+            async_server.call_many([("test_method", None, 1)])
+        with self.assertRaises(TypeError):
+            async_server.call_batch([("test_method", None, 1)])
+        sync_server = JrpcServer(self.http_url, self.version, self.http_transport)
+        with self.assertRaises(TypeError):
+            async_to_sync(sync_server.acall_method)("test_method")
+
+    @patch('http.client.HTTPConnection')
+    def test_call_batch(self, mock_http_conn: MagicMock) -> None:
+        """
+        Тестирование пакетного вызова с ответами в произвольном порядке.
+
+        Args:
+            mock_http_conn (MagicMock): Мок HTTP соединения.
+        """
+        mock_conn = MagicMock()
+        mock_http_conn.return_value = mock_conn
+        mock_conn.getresponse.return_value.read.return_value = (
+            b'[{"jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found"}, "id": 2},'
+            b' {"jsonrpc": "2.0", "result": "success", "id": 1}]'
         )
 
+        server = JrpcServer(self.http_url, self.version, self.http_transport)
+        with server.batch() as batch:
+            batch.add("first_method", {"param": "value"})
+            batch.add("second_method")
+
+        self.assertEqual(batch.results[0]["result"], "success")
+        self.assertEqual(batch.results[1]["error"]["code"], -32601)
+        mock_conn.request.assert_called_once()
+        body = json.loads(mock_conn.request.call_args.kwargs["body"])
+        self.assertEqual([call["method"] for call in body], ["first_method", "second_method"])
+
+    @patch('http.client.HTTPConnection')
+    def test_compression(self, mock_http_conn: MagicMock) -> None:
+        """
+        Тестирование сжатия тела запроса и распаковки сжатого ответа.
+
+        Args:
+            mock_http_conn (MagicMock): Мок HTTP соединения.
+        """
+        mock_conn = MagicMock()
+        mock_http_conn.return_value = mock_conn
+        mock_resp = mock_conn.getresponse.return_value
+        mock_resp.getheader.return_value = 'gzip'
+        mock_resp.read.return_value = gzip.compress(b'{"jsonrpc": "2.0", "result": "success", "id": 1}')
+
+        server = JrpcServer(self.http_url, self.version, HttpTransport(compress_threshold=0))
+        response = server.call_method("test_method", {"param": "value"})
+
+        self.assertEqual(response["result"], "success")
+        request_kwargs = mock_conn.request.call_args.kwargs
+        self.assertEqual(request_kwargs["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(request_kwargs["body"]))["method"], "test_method")
+
+    def test_payload_params(self) -> None:
+        """
+        Тестирование передачи параметров: None не передается, пустые значения сохраняются.
+        """
+        self.assertNotIn("params", json.loads(HttpTransport._create_payload("test_method", None, 1, "2.0")))
+        self.assertEqual(json.loads(HttpTransport._create_payload("test_method", [], 1, "2.0"))["params"], [])
+
+    def test_payload_id_types(self) -> None:
+        """
+        Тестирование кодирования строковых и дробных идентификаторов вызова.
+        """
+        self.assertEqual(json.loads(HttpTransport._create_payload("test_method", None, "abc", "2.0"))["id"], "abc")
+        self.assertEqual(json.loads(HttpTransport._create_payload("test_method", [], 1.5, "2.0"))["id"], 1.5)
+
+    def test_call_many(self) -> None:
+        """
+        Тестирование параллельных вызовов с сохранением порядка ответов.
+        """
+        transport = MagicMock()
+        transport.call.side_effect = lambda *args: {"jsonrpc": "2.0", "result": args[4], "id": args[6]}
+        server = JrpcServer(self.http_url, self.version, transport)
+
+        responses = server.call_many([("first_method", None, 1), ("second_method", {"param": "value"}, 2)])
+
+        self.assertEqual([response["result"] for response in responses], ["first_method", "second_method"])
+        self.assertEqual(transport.call.call_count, 2)
+
+    @patch('http.client.HTTPConnection')
+    def test_call_method_raw(self, mock_http_conn: MagicMock) -> None:
+        """
+        Тестирование потокового чтения ответа и возврата соединения в пул.
+
+        Args:
+            mock_http_conn (MagicMock): Мок HTTP соединения.
+        """
+        mock_conn = MagicMock()
+        mock_http_conn.return_value = mock_conn
+        mock_resp = mock_conn.getresponse.return_value
+        mock_resp.will_close = False
+        mock_resp.getheader.return_value = None
+        mock_resp.read.side_effect = [b'{"jsonrpc": "2.0", "result": ', b'"success", "id": 1}', b'']
+
+        server = JrpcServer(self.http_url, self.version, self.http_transport)
+        raw = server.call_method_raw("test_method")
+
+        self.assertIs(raw.is_error, False)
+        self.assertEqual(json.loads(raw.read())["result"], "success")
+        self.assertEqual(self.http_transport._connections[("http", "example.com", None, None, None)], [mock_conn])
+
+    @patch('http.client.HTTPConnection')
+    def test_call_method_raw_raw_deflate(self, mock_http_conn: MagicMock) -> None:
+        """
+        Тестирование потокового чтения ответа, сжатого deflate без zlib-заголовка.
+
+        Args:
+            mock_http_conn (MagicMock): Мок HTTP соединения.
+        """
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        body = compressor.compress(b'{"jsonrpc": "2.0", "result": "success", "id": 1}') + compressor.flush()
+        mock_conn = MagicMock()
+        mock_http_conn.return_value = mock_conn
+        mock_resp = mock_conn.getresponse.return_value
+        mock_resp.will_close = False
+        mock_resp.getheader.return_value = 'deflate'
+        mock_resp.read.side_effect = [body[:1], body[1:], b'']
+
+        server = JrpcServer(self.http_url, self.version, self.http_transport)
+        raw = server.call_method_raw("test_method")
+
+        self.assertEqual(json.loads(raw.read())["result"], "success")
+
+    def test_peek_is_error(self) -> None:
+        """
+        Тестирование определения ошибки по началу тела ответа.
+        """
+        self.assertIs(StreamedResponse._peek_is_error(b'{"jsonrpc": "2.0", "result": {"error": 1}'), False)
+        self.assertIs(StreamedResponse._peek_is_error(b'{"id": 1, "error": {"code": 1}}'), True)
+        self.assertIsNone(StreamedResponse._peek_is_error(b'{"jsonrpc": "2.'))
+        self.assertIsNone(StreamedResponse._peek_is_error(b''))
+
+    def test_call_batch_duplicate_ids(self) -> None:
+        """
+        Тестирование пакетного вызова с повторяющимися идентификаторами.
+        """
+        server = JrpcServer(self.http_url, self.version, self.http_transport)
+        with self.assertRaises(ValueError):
+            server.call_batch([("first_method", None, 1), ("second_method", None, 1)])
+
+    def test_load_cert_chain_in_memory(self) -> None:
+        """
+        Тестирование загрузки сертификата и ключа без оставленных на диске файлов.
+        """
+        loaded = {}
+
+        def load_cert_chain(certfile: str, keyfile: str) -> None:
+            with open(certfile) as cert, open(keyfile) as key:
+                loaded.update(paths=(certfile, keyfile), cert=cert.read(), key=key.read())
+
+        context = MagicMock()
+        context.load_cert_chain.side_effect = load_cert_chain
+
+        HttpTransport._load_cert_chain(context, "CERT DATA", "KEY DATA")
+
+        self.assertEqual((loaded["cert"], loaded["key"]), ("CERT DATA", "KEY DATA"))
+        for path in loaded["paths"]:
+            self.assertFalse(os.path.exists(path))
+
+    def test_ssl_context_cached(self) -> None:
+        """
+        Тестирование повторного использования SSL-контекста для одних и тех же данных.
+        """
+        self.assertIs(HttpTransport._create_ssl_context(None, None), _DEFAULT_SSL_CONTEXT)
+        with patch.object(HttpTransport, '_load_cert_chain') as mock_load:
+            context = HttpTransport._create_ssl_context("CACHED CERT", "CACHED KEY")
+            self.assertIs(HttpTransport._create_ssl_context("CACHED CERT", "CACHED KEY"), context)
+        self.assertIsNot(context, _DEFAULT_SSL_CONTEXT)
+        mock_load.assert_called_once()
+
+    @patch('socket.create_connection')
+    def test_websocket_call_method(self, mock_create_connection: MagicMock) -> None:
+        """
+        Тестирование вызовов через одно постоянное WebSocket соединение.
+
+        Args:
+            mock_create_connection (MagicMock): Мок создания сокета.
+        """
+        client_sock, server_sock = socket.socketpair()
+        mock_create_connection.return_value = client_sock
+        server = threading.Thread(target=self._serve_websocket, args=(server_sock, 2), daemon=True)
+        server.start()
+
+        with WebSocketTransport(timeout=5) as transport:
+            server_api = JrpcServer("ws://example.com/ws", self.version, transport)
+            first = server_api.call_method("test_method", {"param": "value"})
+            second = server_api.call_method("test_method", call_id=7)
+
+        server.join(5)
+        mock_create_connection.assert_called_once_with(("example.com", 80), 5)
+        self.assertIsNone(client_sock.gettimeout())
+        self.assertEqual(first, {"jsonrpc": "2.0", "result": "test_method", "id": 1})
+        self.assertEqual(second["id"], 7)
+
+    @patch('socket.create_connection')
+    def test_websocket_null_id_reply(self, mock_create_connection: MagicMock) -> None:
+        """
+        Тестирование ответа с "id": null - ожидающий вызов получает ошибку, а не зависает.
+
+        Args:
+            mock_create_connection (MagicMock): Мок создания сокета.
+        """
+        client_sock, server_sock = socket.socketpair()
+        mock_create_connection.return_value = client_sock
+        server = threading.Thread(target=self._serve_websocket, args=(server_sock, 1, True), daemon=True)
+        server.start()
+
+        with WebSocketTransport(timeout=5) as transport:
+            response = JrpcServer("ws://example.com/ws", self.version, transport).call_method("test_method")
+
+        server.join(5)
+        self.assertEqual(response["error"]["code"], -32700)
+
+    @patch('socket.create_connection')
+    def test_websocket_null_id_reply_concurrent(self, mock_create_connection: MagicMock) -> None:
+        """
+        Тестирование ответа с "id": null при нескольких ожидающих вызовах - он не достается чужому вызову.
+
+        Args:
+            mock_create_connection (MagicMock): Мок создания сокета.
+        """
+        client_sock, server_sock = socket.socketpair()
+        mock_create_connection.return_value = client_sock
+        server = threading.Thread(target=self._serve_websocket, args=(server_sock, 2, True), daemon=True)
+        server.start()
+
+        with WebSocketTransport(timeout=5) as transport, \
+                self.assertLogs('jrpc_client.client', level='WARNING'):
+            server_api = JrpcServer("ws://example.com/ws", self.version, transport)
+            responses = server_api.call_many([("first_method", None, 1), ("second_method", None, 2)])
+
+        server.join(5)
+        self.assertEqual([response["result"] for response in responses], ["first_method", "second_method"])
+
+    @patch('socket.create_connection')
+    def test_websocket_closed_by_server(self, mock_create_connection: MagicMock) -> None:
+        """
+        Тестирование закрытия сокета, когда сервер закрывает соединение.
+
+        Args:
+            mock_create_connection (MagicMock): Мок создания сокета.
+        """
+        client_sock, server_sock = socket.socketpair()
+        mock_create_connection.return_value = client_sock
+        server = threading.Thread(target=self._serve_websocket, args=(server_sock, 1), daemon=True)
+        server.start()
+
+        with WebSocketTransport(timeout=5) as transport:
+            JrpcServer("ws://example.com/ws", self.version, transport).call_method("test_method")
+            server.join(5)
+            conn, = transport._connections.values()
+            conn._reader.join(5)
+
+            self.assertTrue(conn.closed)
+            self.assertEqual(client_sock.fileno(), -1)
+
+    @patch('socket.create_connection')
+    def test_websocket_handshake_timeout(self, mock_create_connection: MagicMock) -> None:
+        """
+        Тестирование ограничения времени рукопожатия, если сервер не отвечает на него.
+
+        Args:
+            mock_create_connection (MagicMock): Мок создания сокета.
+        """
+        client_sock, server_sock = socket.socketpair()
+        self.addCleanup(server_sock.close)
+        mock_create_connection.side_effect = lambda address, timeout: (client_sock.settimeout(timeout), client_sock)[1]
+
+        with WebSocketTransport(timeout=0.1) as transport:
+            with self.assertRaises(TimeoutError):
+                JrpcServer("ws://example.com/ws", self.version, transport).call_method("test_method")
+            self.assertEqual(transport._connections, {})
+        self.assertEqual(client_sock.fileno(), -1)
+
+    @staticmethod
+    def _serve_websocket(sock: socket.socket, calls: int, null_id: bool = False) -> None:
+        """
+        Простейший WebSocket сервер: отвечает на рукопожатие и возвращает имя метода.
+
+        Args:
+            sock (socket.socket): Серверный конец соединения.
+            calls (int): Количество обрабатываемых вызовов.
+            null_id (bool): Сначала ответить ошибкой разбора с "id": null.
+        """
+        rfile = sock.makefile('rb')
+        key = ''
+        while (line := rfile.readline().decode().strip()):
+            if line.lower().startswith('sec-websocket-key:'):
+                key = line.split(':', 1)[1].strip()
+        accept = base64.b64encode(
+            hashlib.sha1((key + '258EAFA5-E914-47DA-95CA-C5AB0DC85B11').encode()).digest()).decode()
+        sock.sendall(f'HTTP/1.1 101 Switching Protocols\r\nSec-WebSocket-Accept: {accept}\r\n\r\n'.encode())
+
+        def read_request() -> dict:
+            _, length = rfile.read(2)
+            mask = rfile.read(4)
+            return json.loads(bytes(b ^ mask[i % 4] for i, b in enumerate(rfile.read(length & 0x7F))))
+
+        def send(response: dict) -> None:
+            body = json.dumps(response).encode()
+            sock.sendall(bytes([0x81, len(body)]) + body)
+
+        if null_id:
+            # Ошибка разбора приходит, когда все вызовы уже ожидают ответа, затем - их ответы.
+            requests = [read_request() for _ in range(calls)]
+            send({"jsonrpc": "2.0", "error": {"code": -32700, "message": "Parse error"}, "id": None})
+        else:
+            requests = []
+            for _ in range(calls):
+                request = read_request()
+                send({"jsonrpc": "2.0", "result": request["method"], "id": request["id"]})
+        for request in requests:
+            send({"jsonrpc": "2.0", "result": request["method"], "id": request["id"]})
+        rfile.close()
+        sock.close()
+
     def test_invalid_version(self) -> None:
         """
         Тестирование вызова с неверной версией JSON-RPC.
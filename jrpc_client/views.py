@@ -1,62 +1,181 @@
 import json
 import logging
-from django.http import JsonResponse
+import sys
+import threading
+from typing import TYPE_CHECKING, Union
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse, StreamingHttpResponse
 from django.views import View
 from django.shortcuts import render
 from django.conf import settings
+from .cache import TtlLruCache
 from .forms import JrpcClientForm
-from .client import JrpcServer, http_transport
+
+if TYPE_CHECKING:
+    from .client import JrpcServer
 
 logger = logging.getLogger(__name__)
 
+_server_lock = threading.Lock()
+
+# Сообщения для стандартных кодов ошибок JSON-RPC 2.0. Строки интернируются
+# один раз, и расшифровка этих кодов возвращает их без новых аллокаций.
+_PARSE_ERROR = sys.intern("Parse error: Invalid JSON was received by the server.")
+_INVALID_REQUEST = sys.intern("Invalid Request: The JSON sent is not a valid Request object.")
+_METHOD_NOT_FOUND = sys.intern("Method not found: The method does not exist or is not available.")
+_INVALID_PARAMS = sys.intern("Invalid params: Invalid method parameter(s).")
+_INTERNAL_ERROR = sys.intern("Internal error: Internal JSON-RPC error.")
+
+_JRPC_ERRORS = {
+    -32700: _PARSE_ERROR,
+    -32600: _INVALID_REQUEST,
+    -32601: _METHOD_NOT_FOUND,
+    -32602: _INVALID_PARAMS,
+    -32603: _INTERNAL_ERROR,
+}
+
+# Готовые тела ответов для фиксированных сообщений об ошибках.
+_ERROR_BODIES = {message: json.dumps({'error': message}).encode() for message in _JRPC_ERRORS.values()}
+_INTERNAL_SERVER_ERROR_BODY = json.dumps({'error': 'Internal Server Error'}).encode()
+
+# Диапазон кодов, зарезервированный спецификацией для ошибок сервера.
+_SERVER_ERROR_CODES = frozenset(range(-32099, -31999))
+
+
+def _log_jrpc_response(level: int, message: str, *args, response: Union[dict, str]) -> None:
+    """
+    Пишет в лог ответ JSON-RPC сервиса последним аргументом сообщения.
+
+    Ответ кодируется в JSON, только если запись будет выведена; уже
+    закодированный ответ (строка) передается как есть, без повторного кодирования.
+
+    :param level: Уровень логирования.
+    :param message: Сообщение в %-формате.
+    :param args: Аргументы сообщения перед ответом.
+    :param response: Ответ сервиса (словарь или уже закодированная строка).
+    """
+    if logger.isEnabledFor(level):
+        # stacklevel=2: в записи указывается вызывающий код, а не этот помощник.
+        logger.log(level, message, *args, response if isinstance(response, str) else json.dumps(response),
+                    stacklevel=2)
+
 
 class JrpcClientView(View):
     template_name = 'jrpc_client/client.html'
     jrpc_url = "https://slb.medv.ru/api/v2/"
-    jrpc_server = JrpcServer
-    jrpc_transport = http_transport
-    jrpc_cert = settings.JRPC_CERT
-    jrpc_key = settings.JRPC_KEY
+    # None - значения по умолчанию (JrpcServer, async_http_transport и
+    # сертификат с ключом из настроек), которые определяются при первом вызове.
+    # Синхронный транспорт (http_transport) тоже допустим: вызов уходит в пул потоков.
+    jrpc_server = None
+    jrpc_transport = None
+    jrpc_cert = None
+    jrpc_key = None
     form = JrpcClientForm
+    # Методы только для чтения, успешные ответы которых кэшируются.
+    jrpc_cached_methods = frozenset()
+    jrpc_cache = TtlLruCache(maxsize=10_000, ttl=300)
+    # Максимальный размер кэшируемого тела ответа в символах; большие ответы не кэшируются.
+    jrpc_cache_max_body_size = 64 * 1024
+    # Передавать успешные ответы клиенту потоком, без разбора и повторного кодирования.
+    jrpc_stream_responses = False
 
-    def get(self, request, *args, **kwargs):
+    async def get(self, request, *args, **kwargs):
         """
         Обрабатывает GET-запрос и отображает форму.
+
+        Шаблон компилируется один раз на процесс: при настройках TEMPLATES без
+        явного OPTIONS['loaders'] Django (>= 4.1) сам оборачивает загрузчики
+        в django.template.loaders.cached.Loader. Если загрузчики задаются
+        явно, cached.Loader нужно указать вручную.
         """
         return render(request, self.template_name)
 
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         """
         Обрабатывает POST-запрос, выполняет JSON-RPC вызов и возвращает результат.
         """
         form = self.form(request.POST)
         if not form.is_valid():
-            return JsonResponse(status=400, data=form.errors, safe=False)
+            return HttpResponse(json.dumps(form.errors), status=400, content_type='application/json')
+
+        cleaned_data = form.cleaned_data
+        method = cleaned_data['method']
+        params = cleaned_data['params']
+        cache = self.jrpc_cache
+        cache_key = None
+        if method in self.jrpc_cached_methods:
+            # Кэш может быть общим с подклассами, поэтому адрес сервиса входит в ключ.
+            # Вызов без параметров не требует канонизации params для ключа.
+            cache_key = (self.jrpc_url, method,
+                         None if params is None else json.dumps(params, sort_keys=True))
+            body = cache.get(cache_key)
+            if body is not None:
+                return HttpResponse(body, content_type='application/json')
 
-        server = self.jrpc_server(self.jrpc_url, "2.0", self.jrpc_transport,
-                                  self.jrpc_cert, self.jrpc_key)
+        server = self._get_server()
+        if server.is_async:
+            call_method, call_method_raw = server.acall_method, server.acall_method_raw
+        else:
+            # Синхронный транспорт блокирует, поэтому вызов выполняется в пуле потоков.
+            call_method = sync_to_async(server.call_method, thread_sensitive=False)
+            call_method_raw = sync_to_async(server.call_method_raw, thread_sensitive=False)
 
         try:
-            response = server.call_method(
-                form.cleaned_data['method'],
-                json.loads(form.cleaned_data['params']) if form.cleaned_data['params'] else None
-            )
+            if self.jrpc_stream_responses and cache_key is None:
+                raw = await call_method_raw(method, params)
+                if raw.is_error is False:
+                    logger.info("JSON-RPC Response for %s is streamed", method)
+                    return StreamingHttpResponse(raw, content_type='application/json')
+                response = json.loads(await sync_to_async(raw.read, thread_sensitive=False)())
+            else:
+                response = await call_method(method, params)
 
             if 'error' in response:
                 error_data = response['error']
                 error_message = self._decode_jrpc_error(
                     error_data)
-                logger.error(f"JSON-RPC Error: {error_message}."
-                             f" Original response: {json.dumps(response)}")
-                return JsonResponse(status=400, data={'error': error_message}, safe=False)
+                _log_jrpc_response(logging.ERROR, "JSON-RPC Error: %s. Original response: %s",
+                                   error_message, response=response)
+                error_body = _ERROR_BODIES.get(error_message) or json.dumps({'error': error_message})
+                return HttpResponse(error_body, status=400, content_type='application/json')
 
-            logger.info(f"JSON-RPC Response: {json.dumps(response)}")
-            return JsonResponse(status=200, data=response, safe=False)
+            # Ответ кодируется один раз и используется и для лога, и для тела.
+            # Он уже содержит только JSON-типы, поэтому DjangoJSONEncoder не нужен.
+            body = json.dumps(response)
+            _log_jrpc_response(logging.INFO, "JSON-RPC Response: %s", response=body)
+            if cache_key is not None and len(body) <= self.jrpc_cache_max_body_size:
+                cache.set(cache_key, body)
+            return HttpResponse(body, content_type='application/json')
 
         except Exception as e:
             # Логируем исключение и возвращаем ошибку
-            logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-            return JsonResponse(status=500, data={'error': 'Internal Server Error'}, safe=False)
+            logger.error("Unexpected error: %s", e, exc_info=True)
+            return HttpResponse(_INTERNAL_SERVER_ERROR_BODY, status=500, content_type='application/json')
+
+    @classmethod
+    def _get_server(cls) -> 'JrpcServer':
+        """
+        Возвращает JSON-RPC сервер, созданный один раз для класса представления.
+
+        Сервер и его транспорт переиспользуются между запросами, поэтому
+        соединения из пула транспорта не теряются при каждом POST-запросе.
+        Модуль клиента и сертификат с ключом загружаются здесь, а не при
+        импорте, поэтому не замедляют запуск процессов, не вызывающих API.
+
+        :return: JSON-RPC сервер.
+        """
+        server = cls.__dict__.get('_server_instance')
+        if server is None:
+            with _server_lock:
+                server = cls.__dict__.get('_server_instance')
+                if server is None:
+                    from .client import JrpcServer, async_http_transport
+                    server = (cls.jrpc_server or JrpcServer)(
+                        cls.jrpc_url, "2.0", cls.jrpc_transport or async_http_transport,
+                        settings.JRPC_CERT if cls.jrpc_cert is None else cls.jrpc_cert,
+                        settings.JRPC_KEY if cls.jrpc_key is None else cls.jrpc_key)
+                    cls._server_instance = server
+        return server
 
     @staticmethod
     def _decode_jrpc_error(error_data: dict) -> str:
@@ -70,17 +189,9 @@ class JrpcClientView(View):
         error_message = error_data.get('message', 'Unknown error')
         error_details = error_data.get('data', {})
 
-        if error_code == -32700:
-            return "Parse error: Invalid JSON was received by the server."
-        elif error_code == -32600:
-            return "Invalid Request: The JSON sent is not a valid Request object."
-        elif error_code == -32601:
-            return "Method not found: The method does not exist or is not available."
-        elif error_code == -32602:
-            return "Invalid params: Invalid method parameter(s)."
-        elif error_code == -32603:
-            return "Internal error: Internal JSON-RPC error."
-        elif -32099 <= error_code <= -32000:
+        message = _JRPC_ERRORS.get(error_code)
+        if message is not None:
+            return message
+        if error_code in _SERVER_ERROR_CODES:
             return f"Server error: {error_message}. Details: {error_details}"
-        else:
-            return f"Unknown error: {error_message}. Details: {error_details}"
+        return f"Unknown error: {error_message}. Details: {error_details}"